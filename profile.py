@@ -123,23 +123,32 @@ class GLOBALS:
     DLLOFREQ = 2620.0
     ULHIFREQ = 2510.0
     ULLOFREQ = 2500.0
+    EMULAB_CM = "urn:publicid:IDN+emulab.net+authority+cm"
+    COMP_SERVICES = (
+        "/local/repository/bin/add-nat-and-ip-forwarding.sh",
+        "/local/repository/bin/update-config-files.sh",
+        "/local/repository/bin/tune-cpu.sh",
+        "/local/repository/bin/tune-sdr-iface.sh",
+    )
+    NUC_SERVICES = (
+        "/local/repository/bin/update-config-files.sh",
+        "/local/repository/bin/tune-cpu.sh",
+    )
 
 
 def x310_node_pair(idx, x310_radio):
-    radio_link = request.Link("radio-link-%d"%(idx))
+    radio_link = request.Link(f"radio-link-{idx}")
     radio_link.bandwidth = 10*1000*1000
 
-    node = request.RawPC("%s-comp"%(x310_radio.radio_name))
+    node = request.RawPC(f"{x310_radio.radio_name}-comp")
     node.hardware_type = params.x310_pair_nodetype
     node.disk_image = GLOBALS.SRSLTE_IMG
-    node.component_manager_id = "urn:publicid:IDN+emulab.net+authority+cm"
-    node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/add-nat-and-ip-forwarding.sh"))
-    node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/update-config-files.sh"))
-    node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/tune-cpu.sh"))
-    node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/tune-sdr-iface.sh"))
+    node.component_manager_id = GLOBALS.EMULAB_CM
+    for command in GLOBALS.COMP_SERVICES:
+        node.addService(rspec.Execute(shell="bash", command=command))
 
     if params.include_srslte_src:
-        bs = node.Blockstore("bs-comp-%s"%idx, "/opt/srslte")
+        bs = node.Blockstore(f"bs-comp-{idx}", "/opt/srslte")
         bs.dataset = GLOBALS.SRSLTE_SRC_DS
 
     node_radio_if = node.addInterface("usrp_if")
@@ -147,23 +156,23 @@ def x310_node_pair(idx, x310_radio):
                                                "255.255.255.0"))
     radio_link.addInterface(node_radio_if)
 
-    radio = request.RawPC("%s-x310"%(x310_radio.radio_name))
+    radio = request.RawPC(f"{x310_radio.radio_name}-x310")
     radio.component_id = x310_radio.radio_name
-    radio.component_manager_id = "urn:publicid:IDN+emulab.net+authority+cm"
+    radio.component_manager_id = GLOBALS.EMULAB_CM
     radio_link.addNode(radio)
 
 
 def b210_nuc_pair(idx, b210_node):
-    b210_nuc_pair_node = request.RawPC("b210-%s-%s"%(b210_node.aggregate_id,"nuc2"))
-    agg_full_name = "urn:publicid:IDN+%s.powderwireless.net+authority+cm"%(b210_node.aggregate_id)
+    b210_nuc_pair_node = request.RawPC(f"b210-{b210_node.aggregate_id}-nuc2")
+    agg_full_name = f"urn:publicid:IDN+{b210_node.aggregate_id}.powderwireless.net+authority+cm"
     b210_nuc_pair_node.component_manager_id = agg_full_name
     b210_nuc_pair_node.component_id = "nuc2"
     b210_nuc_pair_node.disk_image = GLOBALS.SRSLTE_IMG
-    b210_nuc_pair_node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/update-config-files.sh"))
-    b210_nuc_pair_node.addService(rspec.Execute(shell="bash", command="/local/repository/bin/tune-cpu.sh"))
+    for command in GLOBALS.NUC_SERVICES:
+        b210_nuc_pair_node.addService(rspec.Execute(shell="bash", command=command))
 
     if params.include_srslte_src:
-        bs = b210_nuc_pair_node.Blockstore("bs-nuc-%s"%idx, "/opt/srslte")
+        bs = b210_nuc_pair_node.Blockstore(f"bs-nuc-{idx}", "/opt/srslte")
         bs.dataset = GLOBALS.SRSLTE_SRC_DS
 
 
@@ -172,20 +181,20 @@ portal.context.defineParameter("include_srslte_src",
                                portal.ParameterType.BOOLEAN,
                                False)
 
-node_type = [
+NODE_TYPES = (
     ("d740",
      "Emulab, d740"),
     ("d430",
      "Emulab, d430")
-]
+)
 
 portal.context.defineParameter("x310_pair_nodetype",
                                "Type of compute node paired with the X310 Radios",
                                portal.ParameterType.STRING,
-                               node_type[0],
-                               node_type)
+                               NODE_TYPES[0],
+                               NODE_TYPES)
 
-rooftop_names = [
+ROOFTOP_NAMES = (
     ("cellsdr1-browning",
      "Emulab, cellsdr1-browning (Browning)"),
     ("cellsdr1-bes",
@@ -204,7 +213,7 @@ rooftop_names = [
      "Emulab, cellsdr1-hospital (Hospital)"),
     ("cellsdr1-ustar",
      "Emulab, cellsdr1-ustar (USTAR)"),
-]
+)
 
 portal.context.defineStructParameter("x310_radios", "X310 Radios", [],
                                      multiValue=True,
@@ -216,11 +225,11 @@ portal.context.defineStructParameter("x310_radios", "X310 Radios", [],
                                              "radio_name",
                                              "Rooftop base-station X310",
                                              portal.ParameterType.STRING,
-                                             rooftop_names[0],
-                                             rooftop_names)
+                                             ROOFTOP_NAMES[0],
+                                             ROOFTOP_NAMES)
                                      ])
 
-fixed_endpoint_aggregates = [
+FIXED_ENDPOINT_AGGREGATES = (
     ("web",
      "WEB, nuc2"),
     ("bookstore",
@@ -241,7 +250,7 @@ fixed_endpoint_aggregates = [
      "Central Parking Garage, nuc2"),
     ("guesthouse",
      "Guest House, nuc2"),
-]
+)
 
 portal.context.defineStructParameter("b210_nodes", "B210 Radios", [],
                                      multiValue=True,
@@ -251,8 +260,8 @@ portal.context.defineStructParameter("b210_nodes", "B210 Radios", [],
                                              "aggregate_id",
                                              "Fixed Endpoint B210",
                                              portal.ParameterType.STRING,
-                                             fixed_endpoint_aggregates[0],
-                                             fixed_endpoint_aggregates)
+                                             FIXED_ENDPOINT_AGGREGATES[0],
+                                             FIXED_ENDPOINT_AGGREGATES)
                                      ],
                                     )
 